@@ -23,7 +23,7 @@ actor AIActor {
         request.timeoutInterval = 60
         request.httpBody = try JSONSerialization.data(withJSONObject: body)
         
-        let (data, response) = try await URLSession.shared.data(for: request)
+        let (data, response) = try await URLSession.ai.data(for: request)
         
         guard let httpResponse = response as? HTTPURLResponse, httpResponse.statusCode == 200 else {
             let errorMessage = String(data: data, encoding: .utf8) ?? "Unknown Error"
@@ -59,7 +59,7 @@ actor AIActor {
                     streamBody["stream"] = true
                     request.httpBody = try JSONSerialization.data(withJSONObject: streamBody)
                     
-                    let (bytes, response) = try await URLSession.shared.bytes(for: request)
+                    let (bytes, response) = try await URLSession.ai.bytes(for: request)
                     
                     guard let httpResponse = response as? HTTPURLResponse, httpResponse.statusCode == 200 else {
                         throw URLError(.badServerResponse)
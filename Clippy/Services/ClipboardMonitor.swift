@@ -88,8 +88,8 @@ class ClipboardMonitor: ObservableObject {
         if currentChangeCount != lastChangeCount {
             lastChangeCount = currentChangeCount
             
-            // Check for images first
-            if let imageData = pasteboard.data(forType: .tiff) ?? pasteboard.data(forType: .png) {
+            // Check for images first (PNG preferred: it can be stored without re-encoding)
+            if let imageData = pasteboard.data(forType: .png) ?? pasteboard.data(forType: .tiff) {
                 clipboardContent = "[Image]"
                 saveImageItem(imageData: imageData)
             }
@@ -105,26 +105,30 @@ class ClipboardMonitor: ObservableObject {
     
     // MARK: - Image Handling
     
-    private func getImagesDirectory() -> URL {
-        let appSupport = FileManager.default.urls(for: .applicationSupportDirectory, in: .userDomainMask)[0]
-        let imagesDir = appSupport.appendingPathComponent("Clippy/Images")
-        try? FileManager.default.createDirectory(at: imagesDir, withIntermediateDirectories: true)
-        return imagesDir
-    }
+    private static let pngSignature: [UInt8] = [0x89, 0x50, 0x4E, 0x47, 0x0D, 0x0A, 0x1A, 0x0A]
     
     private func saveImageItem(imageData: Data) {
         guard let repository = repository else { return }
         
         print("💾 [ClipboardMonitor] Saving new image item...")
         
-        guard let nsImage = NSImage(data: imageData),
-              let pngData = nsImage.pngData() else {
-            print("   ❌ Failed to convert image to PNG format")
-            return
+        let pngData: Data
+        if imageData.starts(with: Self.pngSignature) {
+            // Already PNG: skip the decode + recompress pass
+            pngData = imageData
+        } else {
+            // Decode the pasteboard bytes straight into a bitmap; going through NSImage
+            // re-encodes a full TIFF copy only to decode it again
+            guard let bitmapImage = NSBitmapImageRep(data: imageData),
+                  let convertedData = bitmapImage.representation(using: .png, properties: [:]) else {
+                print("   ❌ Failed to convert image to PNG format")
+                return
+            }
+            pngData = convertedData
         }
         
         let filename = "\(UUID().uuidString).png"
-        let imageURL = getImagesDirectory().appendingPathComponent(filename)
+        let imageURL = ClipboardService.shared.getImagesDirectory().appendingPathComponent(filename)
         
         do {
             try pngData.write(to: imageURL)
@@ -162,8 +166,7 @@ class ClipboardMonitor: ObservableObject {
             var description: String = "[Image]"
             
             if let localService = await self.localAIService {
-                let base64Image = pngData.base64EncodedString()
-                if let localDesc = await localService.generateVisionDescription(base64Image: base64Image, screenText: nil) {
+                if let localDesc = await localService.generateVisionDescription(imageData: pngData, screenText: nil) {
                     description = localDesc
                     if localDesc.contains("Title:") {
                         let lines = localDesc.split(separator: "\n")
@@ -267,28 +270,22 @@ class ClipboardMonitor: ObservableObject {
     }
 }
 
-// MARK: - NSImage PNG Extension
-
-extension NSImage {
-    func pngData() -> Data? {
-        guard let tiffData = self.tiffRepresentation,
-              let bitmapImage = NSBitmapImageRep(data: tiffData) else {
-            return nil
-        }
-        return bitmapImage.representation(using: .png, properties: [:])
-    }
-}
-
 // MARK: - Clipboard Service (Copy/Paste Operations)
 
 class ClipboardService {
     static let shared = ClipboardService()
     
-    private init() {}
+    // Resolved and created once; image saves and loads reuse the same URL
+    private let imagesDirectory: URL
     
-    func getImagesDirectory() -> URL {
+    private init() {
         let appSupport = FileManager.default.urls(for: .applicationSupportDirectory, in: .userDomainMask)[0]
-        return appSupport.appendingPathComponent("Clippy/Images")
+        imagesDirectory = appSupport.appendingPathComponent("Clippy/Images")
+        try? FileManager.default.createDirectory(at: imagesDirectory, withIntermediateDirectories: true)
+    }
+    
+    func getImagesDirectory() -> URL {
+        imagesDirectory
     }
     
     func loadImage(from path: String) -> NSImage? {
@@ -16,6 +16,8 @@ protocol ClipboardRepository {
     
     func deleteItem(_ item: Item) async throws
     
+    func deleteItems(_ items: [Item]) async throws
+    
     func updateItem(_ item: Item) async throws
     
     func findDuplicate(content: String) -> Item?
@@ -31,6 +33,18 @@ class SwiftDataClipboardRepository: ClipboardRepository {
         self.vectorService = vectorService
     }
     
+    // Vector DB work runs after the SwiftData write, one operation at a time in call order,
+    // so the list never waits on the embedding model and a stale upsert can't land last
+    private var pendingVectorWork: Task<Void, Never>?
+    
+    private func enqueueVectorWork(_ work: @escaping @MainActor () async -> Void) {
+        let previous = pendingVectorWork
+        pendingVectorWork = Task {
+            await previous?.value
+            await work()
+        }
+    }
+    
     func saveItem(
         content: String,
         appName: String,
@@ -53,19 +67,21 @@ class SwiftDataClipboardRepository: ClipboardRepository {
         )
         newItem.tags = tags
         
-        // 2. Add to Vector DB
         // If vectorId is provided, use it. Otherwise generate one.
         let finalVectorId = vectorId ?? UUID()
         newItem.vectorId = finalVectorId
         
+        // 2. Save to SwiftData
+        modelContext.insert(newItem)
+        
+        // 3. Add to Vector DB (queued; may wait for the embedding model to load)
         // Combine Title and Content for search embedding so both are searchable
         // Logic mirrored from ClipboardMonitor
         let embeddingText = (title != nil && !title!.isEmpty) ? "\(title!)\n\n\(content)" : content
         
-        await vectorService.addDocument(vectorId: finalVectorId, text: embeddingText)
-        
-        // 3. Save to SwiftData
-        modelContext.insert(newItem)
+        enqueueVectorWork { [vectorService] in
+            await vectorService.addDocument(vectorId: finalVectorId, text: embeddingText)
+        }
         
         // Note: Autosave is usually enabled, but we can force it if needed.
         // try modelContext.save()
@@ -75,27 +91,49 @@ class SwiftDataClipboardRepository: ClipboardRepository {
     }
     
     func deleteItem(_ item: Item) async throws {
-        // 1. Remove from Vector DB
-        if let vectorId = item.vectorId {
-             // 1. Remove from Vector DB (Async)
-             try? await vectorService.deleteDocument(vectorId: vectorId)
+        try await deleteItems([item])
+    }
+    
+    func deleteItems(_ items: [Item]) async throws {
+        let vectorIds = items.compactMap { $0.vectorId }
+        
+        // 1. Remove from SwiftData
+        for item in items {
+            modelContext.delete(item)
         }
         
-        // 2. Remove from SwiftData
-        modelContext.delete(item)
+        // 2. Remove from Vector DB in a single call (queued)
+        enqueueVectorWork { [vectorService] in
+            do {
+                try await vectorService.deleteDocuments(vectorIds: vectorIds)
+            } catch {
+                // One bad ID fails the whole batch; retry individually so the rest still get removed
+                print("⚠️ [Repository] Batch vector delete failed (\(error)), retrying per item")
+                for vectorId in vectorIds {
+                    do {
+                        try await vectorService.deleteDocument(vectorId: vectorId)
+                    } catch {
+                        print("❌ [Repository] Failed to delete vector \(vectorId): \(error)")
+                    }
+                }
+            }
+        }
     }
     
     func updateItem(_ item: Item) async throws {
         // 1. Save SwiftData changes
         try modelContext.save()
         
-        // 2. Update Vector DB
+        // 2. Update Vector DB (queued)
         if let vectorId = item.vectorId {
             let embeddingText = (item.title != nil && !item.title!.isEmpty) ? "\(item.title!)\n\n\(item.content)" : item.content
+            let title = item.title
             
-             // Clippy.addDocument overwrites if ID exists (upsert)
-            await vectorService.addDocument(vectorId: vectorId, text: embeddingText)
-            print("💾 [Repository] Updated item and re-indexed vector: \(item.title ?? "Untitled")")
+            enqueueVectorWork { [vectorService] in
+                // Clippy.addDocument overwrites if ID exists (upsert)
+                await vectorService.addDocument(vectorId: vectorId, text: embeddingText)
+                print("💾 [Repository] Updated item and re-indexed vector: \(title ?? "Untitled")")
+            }
         }
     }
     
@@ -1,4 +1,5 @@
 import Foundation
+import CryptoKit
 import SwiftData
 import VecturaMLXKit
 import VecturaKit
@@ -11,7 +12,24 @@ class Clippy: ObservableObject {
     
     private var vectorDB: VecturaMLXKit?
     
+    // Qwen3-Embedding expects an instruction on the query side only; documents are embedded as-is
+    private static let queryInstruction = "Instruct: Given a question about clipboard history, retrieve the clipboard items that answer it\nQuery: "
+    
+    // Shared so callers arriving before startup finishes wait on the same load
+    private var initializationTask: Task<Void, Never>?
+    
     func initialize() async {
+        if let initializationTask {
+            await initializationTask.value
+            return
+        }
+        
+        let task = Task { await loadVectorDB() }
+        initializationTask = task
+        await task.value
+    }
+    
+    private func loadVectorDB() async {
         print("🚀 [Clippy] Initializing...")
         do {
             let config = VecturaConfig(
@@ -23,6 +41,10 @@ class Clippy: ObservableObject {
                 config: config,
                 modelConfiguration: .qwen3_embedding
             )
+            
+            // Throwaway query so the first real search doesn't pay the model's cold start
+            statusMessage = "Warming up embedding model..."
+            _ = try? await vectorDB?.search(query: Self.queryInstruction + "warmup", numResults: 1, threshold: nil)
              
             isInitialized = true
             statusMessage = "Ready (Qwen3-Embedding-0.6B)"
@@ -33,11 +55,22 @@ class Clippy: ObservableObject {
         }
     }
     
+    // SHA-256 of the text last embedded per vector, so upserts with unchanged text skip the model
+    private var indexedTextHashes: [UUID: SHA256Digest] = [:]
+    
     func addDocument(vectorId: UUID, text: String) async {
+        let textHash = SHA256.hash(data: Data(text.utf8))
+        if indexedTextHashes[vectorId] == textHash {
+            print("⏭️ [Clippy] Skipping re-embed, text unchanged for \(vectorId)")
+            return
+        }
+        
         await addDocuments(items: [(vectorId, text)])
     }
     
     func addDocuments(items: [(UUID, String)]) async {
+        await initialize()
+        
         guard let vectorDB = vectorDB else { 
             print("⚠️ [Clippy] Cannot add documents - vectorDB not initialized")
             return 
@@ -47,20 +80,29 @@ class Clippy: ObservableObject {
         print("📝 [Clippy] Adding \(count) documents...")
         
         do {
-            let texts = items.map { $0.1 }
-            let ids = items.map { $0.0 }
-            
-            _ = try await vectorDB.addDocuments(
-                texts: texts,
-                ids: ids
-            )
+            try await insertDocuments(items, into: vectorDB)
             print("   ✅ Added \(count) documents to Vector DB")
         } catch {
             print("   ❌ Failed to add documents: \(error)")
         }
     }
     
+    private func insertDocuments(_ items: [(UUID, String)], into vectorDB: VecturaMLXKit) async throws {
+        let texts = items.map { $0.1 }
+        let ids = items.map { $0.0 }
+        
+        _ = try await vectorDB.addDocuments(
+            texts: texts,
+            ids: ids
+        )
+        for (id, text) in items {
+            indexedTextHashes[id] = SHA256.hash(data: Data(text.utf8))
+        }
+    }
+    
     func search(query: String, limit: Int = 10) async -> [(UUID, Float)] {
+        await initialize()
+        
         guard let vectorDB = vectorDB else { 
             print("⚠️ [Clippy] Cannot search - vectorDB not initialized")
             return [] 
@@ -70,15 +112,18 @@ class Clippy: ObservableObject {
         
         do {
             let results = try await vectorDB.search(
-                query: query,
+                query: Self.queryInstruction + query,
                 numResults: limit,
                 threshold: nil // No threshold, we'll rank ourselves
             )
             
             print("   ✅ Found \(results.count) results")
+            #if DEBUG
+            // Per-hit logging formats every score; keep it out of release builds
             for (index, result) in results.prefix(5).enumerated() {
                 print("      \(index + 1). ID: \(result.id), Score: \(String(format: "%.3f", result.score))")
             }
+            #endif
             
             return results.map { ($0.id, $0.score) }
         } catch {
@@ -88,8 +133,39 @@ class Clippy: ObservableObject {
     }
     
     func deleteDocument(vectorId: UUID) async throws {
-        guard let vectorDB = vectorDB else { return }
+        try await deleteDocuments(vectorIds: [vectorId])
+    }
+    
+    func deleteDocuments(vectorIds: [UUID]) async throws {
+        await initialize()
+        
+        guard let vectorDB = vectorDB, !vectorIds.isEmpty else { return }
+        
+        for vectorId in vectorIds {
+            indexedTextHashes.removeValue(forKey: vectorId)
+        }
+        try await vectorDB.deleteDocuments(ids: vectorIds)
+    }
+    
+    /// Rebuild the index from scratch so vectors of deleted items stop taking nearest-neighbor slots.
+    /// `documents` is read after the reset, so items saved meanwhile are not lost. Throws if the
+    /// store is unavailable or re-embedding fails, in which case the index may be partial until the
+    /// next successful rebuild; returns the number of documents indexed.
+    func rebuildIndex(documents: () throws -> [(UUID, String)]) async throws -> Int {
+        await initialize()
         
-        try await vectorDB.deleteDocuments(ids: [vectorId])
+        guard let vectorDB = vectorDB else {
+            throw NSError(domain: "Clippy", code: -1, userInfo: [NSLocalizedDescriptionKey: "Vector DB not initialized"])
+        }
+        
+        indexedTextHashes.removeAll()
+        try await vectorDB.reset()
+        print("🗑️ [Clippy] Vector index reset")
+        
+        let items = try documents()
+        if !items.isEmpty {
+            try await insertDocuments(items, into: vectorDB)
+        }
+        return items.count
     }
 }
@@ -29,10 +29,13 @@ class ElevenLabsService: ObservableObject {
         let boundary = UUID().uuidString
         request.setValue("multipart/form-data; boundary=\(boundary)", forHTTPHeaderField: "Content-Type")
         
-        let data = try createMultipartBody(fileURL: audioFileURL, boundary: boundary)
-        print("📦 [ElevenLabs] Request body size: \(data.count) bytes")
+        let bodyURL = try createMultipartBodyFile(fileURL: audioFileURL, boundary: boundary)
+        defer { try? FileManager.default.removeItem(at: bodyURL) }
+        let bodySize = (try? FileManager.default.attributesOfItem(atPath: bodyURL.path)[.size] as? Int) ?? 0
+        print("📦 [ElevenLabs] Request body size: \(bodySize) bytes")
         
-        let (responseData, response) = try await URLSession.shared.upload(for: request, from: data)
+        // Upload streams the body from disk instead of holding it in memory
+        let (responseData, response) = try await URLSession.ai.upload(for: request, fromFile: bodyURL)
         
         guard let httpResponse = response as? HTTPURLResponse else {
             throw NSError(domain: "ElevenLabs", code: 0, userInfo: [NSLocalizedDescriptionKey: "Invalid response"])
@@ -60,24 +63,42 @@ class ElevenLabsService: ObservableObject {
         return ""
     }
     
-    private func createMultipartBody(fileURL: URL, boundary: String) throws -> Data {
-        var data = Data()
-        let fileData = try Data(contentsOf: fileURL)
-        
-        // Add Model ID param
-        data.append("--\(boundary)\r\n".data(using: .utf8)!)
-        data.append("Content-Disposition: form-data; name=\"model_id\"\r\n\r\n".data(using: .utf8)!)
-        data.append("scribe_v1\r\n".data(using: .utf8)!)
-        
-        // Add File
-        data.append("--\(boundary)\r\n".data(using: .utf8)!)
-        data.append("Content-Disposition: form-data; name=\"file\"; filename=\"audio.m4a\"\r\n".data(using: .utf8)!)
-        data.append("Content-Type: audio/m4a\r\n\r\n".data(using: .utf8)!)
-        data.append(fileData)
-        data.append("\r\n".data(using: .utf8)!)
-        
-        data.append("--\(boundary)--\r\n".data(using: .utf8)!)
-        return data
+    /// Writes the multipart body to a temporary file, copying the audio in chunks
+    private func createMultipartBodyFile(fileURL: URL, boundary: String) throws -> URL {
+        let bodyURL = FileManager.default.temporaryDirectory.appendingPathComponent("clippy_upload_\(boundary).multipart")
+        FileManager.default.createFile(atPath: bodyURL.path, contents: nil)
+        
+        do {
+            let output = try FileHandle(forWritingTo: bodyURL)
+            defer { try? output.close() }
+            
+            var header = Data()
+            
+            // Add Model ID param
+            header.append("--\(boundary)\r\n".data(using: .utf8)!)
+            header.append("Content-Disposition: form-data; name=\"model_id\"\r\n\r\n".data(using: .utf8)!)
+            header.append("scribe_v1\r\n".data(using: .utf8)!)
+            
+            // Add File
+            header.append("--\(boundary)\r\n".data(using: .utf8)!)
+            header.append("Content-Disposition: form-data; name=\"file\"; filename=\"audio.m4a\"\r\n".data(using: .utf8)!)
+            header.append("Content-Type: audio/m4a\r\n\r\n".data(using: .utf8)!)
+            try output.write(contentsOf: header)
+            
+            let input = try FileHandle(forReadingFrom: fileURL)
+            defer { try? input.close() }
+            while let chunk = try input.read(upToCount: 64 * 1024), !chunk.isEmpty {
+                try output.write(contentsOf: chunk)
+            }
+            
+            try output.write(contentsOf: "\r\n--\(boundary)--\r\n".data(using: .utf8)!)
+        } catch {
+            // The caller only cleans up once a body URL is returned
+            try? FileManager.default.removeItem(at: bodyURL)
+            throw error
+        }
+        
+        return bodyURL
     }
 }
 
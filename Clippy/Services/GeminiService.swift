@@ -25,6 +25,7 @@ class GeminiService: ObservableObject, AIServiceProtocol {
     private var apiKey: String
     private let baseURL = "https://generativelanguage.googleapis.com/v1beta/models"
     private let modelName = "gemini-2.5-flash"
+    private let decoder = JSONDecoder() // Reused across responses
     
     init(apiKey: String) {
         self.apiKey = apiKey
@@ -40,6 +41,15 @@ class GeminiService: ObservableObject, AIServiceProtocol {
         !apiKey.isEmpty
     }
     
+    /// Open the TLS connection to the Gemini host ahead of the first query
+    func prewarmConnection() {
+        guard hasValidAPIKey, let url = URL(string: baseURL) else { return }
+        
+        var request = URLRequest(url: url)
+        request.httpMethod = "HEAD"
+        URLSession.ai.dataTask(with: request).resume()
+    }
+    
     /// Clear the last error
     func clearError() {
         lastError = nil
@@ -53,6 +63,13 @@ class GeminiService: ObservableObject, AIServiceProtocol {
         clipboardContext: [(content: String, tags: [String])],
         appName: String?
     ) async -> (answer: String?, imageIndex: Int?) {
+        // Checked before building the prompt; nothing useful can happen without a key
+        guard hasValidAPIKey else {
+            print("⚠️ [GeminiService] No valid API key configured, skipping answer")
+            lastErrorMessage = "API key not configured. Go to Settings to add your Gemini API key."
+            return (nil, nil)
+        }
+        
         print("🤖 [GeminiService] Generating answer with image detection...")
         print("   Question: \(question)")
         print("   Clipboard items: \(clipboardContext.count)")
@@ -109,6 +126,11 @@ class GeminiService: ObservableObject, AIServiceProtocol {
         appName: String?,
         context: String?
     ) async -> [String] {
+        guard hasValidAPIKey else {
+            print("⚠️ [GeminiService] No valid API key configured, skipping tags")
+            return []
+        }
+        
         print("🏷️  [GeminiService] Generating tags...")
         print("   Content: \(content.prefix(100))...")
         print("   App: \(appName ?? "Unknown")")
@@ -209,12 +231,6 @@ class GeminiService: ObservableObject, AIServiceProtocol {
     }
     
     private func callGeminiForAnswerWithImage(prompt: String) async -> (String?, Int?)? {
-        guard !apiKey.isEmpty else {
-            print("   ⚠️  No valid API key configured")
-            lastErrorMessage = "API key not configured. Go to Settings to add your Gemini API key."
-            return nil
-        }
-        
         print("   📤 Sending prompt to Gemini for answer...")
         
         // Construct request URL
@@ -246,7 +262,7 @@ class GeminiService: ObservableObject, AIServiceProtocol {
         do {
             request.httpBody = try JSONSerialization.data(withJSONObject: requestBody)
             
-            let (data, response) = try await URLSession.shared.data(for: request)
+            let (data, response) = try await URLSession.ai.data(for: request)
             
             guard let httpResponse = response as? HTTPURLResponse else {
                 lastError = "Invalid response"
@@ -282,7 +298,6 @@ class GeminiService: ObservableObject, AIServiceProtocol {
             lastErrorMessage = nil
             
             // Parse response
-            let decoder = JSONDecoder()
             let apiResponse = try decoder.decode(GeminiAPIResponse.self, from: data)
             
             guard let text = apiResponse.candidates?.first?.content?.parts?.first?.text else {
@@ -346,11 +361,6 @@ class GeminiService: ObservableObject, AIServiceProtocol {
     }
     
     private func callGemini(prompt: String) async -> [String]? {
-        guard !apiKey.isEmpty else {
-            print("   ⚠️  No valid API key configured")
-            return nil
-        }
-        
         print("   📤 Sending prompt to Gemini for tagging...")
         
         guard let url = URL(string: "\(baseURL)/\(modelName):generateContent?key=\(apiKey)") else {
@@ -379,7 +389,7 @@ class GeminiService: ObservableObject, AIServiceProtocol {
         do {
             request.httpBody = try JSONSerialization.data(withJSONObject: requestBody)
             
-            let (data, response) = try await URLSession.shared.data(for: request)
+            let (data, response) = try await URLSession.ai.data(for: request)
             
             guard let httpResponse = response as? HTTPURLResponse else {
                 lastError = "Invalid response"
@@ -396,7 +406,6 @@ class GeminiService: ObservableObject, AIServiceProtocol {
             }
             
             // Parse response
-            let decoder = JSONDecoder()
             let apiResponse = try decoder.decode(GeminiAPIResponse.self, from: data)
             
             guard let text = apiResponse.candidates?.first?.content?.parts?.first?.text else {
@@ -444,38 +453,38 @@ class GeminiService: ObservableObject, AIServiceProtocol {
         print("🖼️ [GeminiService] Analyzing image...")
         print("   Image size: \(imageData.count) bytes")
         
-        let base64Image = imageData.base64EncodedString()
-        
         guard let url = URL(string: "\(baseURL)/\(modelName):generateContent?key=\(apiKey)") else {
             return nil
         }
         
-        let requestBody: [String: Any] = [
-            "contents": [
-                [
-                    "parts": [
-                        ["text": "give quick summary of it."],
-                        [
-                            "inline_data": [
-                                "mime_type": "image/png",
-                                "data": base64Image
-                            ]
-                        ]
-                    ]
-                ]
-            ],
-            "generationConfig": [
-                "maxOutputTokens": 8192
-            ]
-        ]
-        
         var request = URLRequest(url: url)
         request.httpMethod = "POST"
         request.setValue("application/json", forHTTPHeaderField: "Content-Type")
         
         do {
-            request.httpBody = try JSONSerialization.data(withJSONObject: requestBody)
-            let (data, response) = try await URLSession.shared.data(for: request)
+            // Base64 + JSON encoding of a multi-MB screenshot runs off the main actor
+            request.httpBody = try await Task.detached(priority: .userInitiated) {
+                let requestBody: [String: Any] = [
+                    "contents": [
+                        [
+                            "parts": [
+                                ["text": "give quick summary of it."],
+                                [
+                                    "inline_data": [
+                                        "mime_type": "image/png",
+                                        "data": imageData.base64EncodedString()
+                                    ]
+                                ]
+                            ]
+                        ]
+                    ],
+                    "generationConfig": [
+                        "maxOutputTokens": 8192
+                    ]
+                ]
+                return try JSONSerialization.data(withJSONObject: requestBody)
+            }.value
+            let (data, response) = try await URLSession.ai.data(for: request)
             
             guard let httpResponse = response as? HTTPURLResponse else {
                 return nil
@@ -490,7 +499,6 @@ class GeminiService: ObservableObject, AIServiceProtocol {
             }
             
             // Parse response
-            let decoder = JSONDecoder()
             let apiResponse = try decoder.decode(GeminiAPIResponse.self, from: data)
             
             if let text = apiResponse.candidates?.first?.content?.parts?.first?.text {
@@ -23,6 +23,9 @@ class LocalAIService: ObservableObject, AIServiceProtocol {
     
     // MARK: - Model Loading
     
+    // Shared so concurrent callers (RAG warm-up, tagging) wait on one load instead of starting another
+    private var modelLoadTask: Task<Void, Never>?
+    
     /// Load the LLM model into memory
     func loadModel() async {
         guard modelContainer == nil else {
@@ -30,6 +33,18 @@ class LocalAIService: ObservableObject, AIServiceProtocol {
             return
         }
         
+        if let modelLoadTask {
+            await modelLoadTask.value
+            return
+        }
+        
+        let task = Task { await performModelLoad() }
+        modelLoadTask = task
+        await task.value
+        modelLoadTask = nil // A failed load can be retried by the next caller
+    }
+    
+    private func performModelLoad() async {
         print("🔄 [LocalAIService] Loading model: \(modelId)")
         statusMessage = "Downloading model..."
         isProcessing = true
@@ -208,7 +223,9 @@ class LocalAIService: ObservableObject, AIServiceProtocol {
     }
     
     /// Vision description - placeholder
-    func generateVisionDescription(base64Image: String, screenText: String? = nil) async -> String? {
+    /// Takes raw image bytes; base64 encoding belongs here once a vision model needs it,
+    /// so callers don't encode multi-MB images that are never read.
+    func generateVisionDescription(imageData: Data, screenText: String? = nil) async -> String? {
         return screenText ?? "Image analysis requires vision model"
     }
     
@@ -234,14 +251,21 @@ class LocalAIService: ObservableObject, AIServiceProtocol {
     
     // MARK: - Helper Methods
     
+    private static let relativeFormatter: RelativeDateTimeFormatter = {
+        let formatter = RelativeDateTimeFormatter()
+        formatter.unitsStyle = .short
+        return formatter
+    }()
+    
     private func buildContextString(_ clipboardContext: [RAGContextItem], maxLength: Int = 5000) -> String {
         if clipboardContext.isEmpty { return "No context available." }
         
-        let formatter = RelativeDateTimeFormatter()
-        formatter.unitsStyle = .short
+        let formatter = Self.relativeFormatter
         let now = Date()
         
-        var result = ""
+        // Collect entries and join once; track length incrementally instead of re-counting the whole string
+        var entries: [String] = []
+        var length = 0
         
         for (index, item) in clipboardContext.prefix(10).enumerated() {
             let timeString = formatter.localizedString(for: item.timestamp, relativeTo: now)
@@ -252,11 +276,12 @@ class LocalAIService: ObservableObject, AIServiceProtocol {
             }
             
             entry += String(item.content.prefix(500))
-            result += entry + "\n\n"
+            entries.append(entry)
+            length += entry.count + 2
             
-            if result.count > maxLength { break }
+            if length > maxLength { break }
         }
         
-        return result
+        return entries.joined(separator: "\n\n") + "\n\n"
     }
 }
@@ -5,6 +5,9 @@ import SwiftData
 
 @Model
 final class Item {
+    // Every list @Query and findDuplicate sort by recency
+    #Index<Item>([\.timestamp])
+    
     var timestamp: Date
     var content: String
     var title: String? // Added for structured content (e.g., Vision titles)
@@ -0,0 +1,12 @@
+import Foundation
+
+extension URLSession {
+    /// Shared session for AI API traffic. One long-lived session keeps TLS/HTTP2
+    /// connections to each API host alive across requests.
+    static let ai: URLSession = {
+        let configuration = URLSessionConfiguration.default
+        configuration.httpMaximumConnectionsPerHost = 4
+        configuration.urlCache = nil // Responses are never cacheable POSTs
+        return URLSession(configuration: configuration)
+    }()
+}
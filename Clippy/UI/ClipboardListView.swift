@@ -7,7 +7,6 @@ struct ClipboardListView: View {
     @Binding var searchText: String
     
     @EnvironmentObject var container: AppDependencyContainer
-    @Environment(\.modelContext) private var modelContext
     @Query(sort: \Item.timestamp, order: .reverse) private var allItems: [Item]
     
     @State private var searchResults: [Item] = []
@@ -210,13 +209,8 @@ struct ClipboardListView: View {
     }
     
     private func deleteItem(_ item: Item) {
-        modelContext.delete(item)
-        // Note: For complete consistency, we should also delete from Vector DB using ClipboardRepository if available,
-        // but modelContext deletion is propagated via NotificationCenter if setup, or we rely on next app launch sync.
-        // For now, this suffices for UI.
-        Task {
-             try? await container.clippy.deleteDocument(vectorId: item.vectorId ?? UUID())
-        }
+        guard let repository = container.repository else { return }
+        Task { try? await repository.deleteItem(item) }
     }
 }
 
@@ -341,10 +335,15 @@ struct ClipboardItemRow: View {
         }
     }
     
-    private func timeAgo(from date: Date) -> String {
+    // Built once; formatter setup is far costlier than formatting and this runs per row render
+    private static let relativeFormatter: RelativeDateTimeFormatter = {
         let formatter = RelativeDateTimeFormatter()
         formatter.unitsStyle = .abbreviated
-        return formatter.localizedString(for: date, relativeTo: Date())
+        return formatter
+    }()
+    
+    private func timeAgo(from date: Date) -> String {
+        Self.relativeFormatter.localizedString(for: date, relativeTo: Date())
     }
 }
 
@@ -132,6 +132,9 @@ struct ContentView: View {
         let storedKey = getStoredAPIKey()
         if !storedKey.isEmpty {
             geminiService.updateApiKey(storedKey)
+            if selectedAIService == .gemini {
+                geminiService.prewarmConnection()
+            }
         }
         
         // Initialize ElevenLabs Service
@@ -224,8 +227,7 @@ struct ContentView: View {
                             self.clippyController.setState(.thinking, message: "Analyzing image... 🧠")
                             
                             Task {
-                                let base64Image = imageData.base64EncodedString()
-                                if let description = await self.localAIService.generateVisionDescription(base64Image: base64Image) {
+                                if let description = await self.localAIService.generateVisionDescription(imageData: imageData) {
                                     await MainActor.run {
                                         self.saveVisionContent(description, originalText: parsedContent.fullText)
                                         self.clippyController.setState(.done, message: "Image analyzed! ✨")
@@ -340,25 +342,37 @@ struct ContentView: View {
         clippyController.setState(.thinking)
         
         Task {
+            // Load the local model while the vector search runs instead of after it
+            let modelWarmup = Task {
+                if selectedAIService == .local && !localAIService.isModelLoaded {
+                    await localAIService.loadModel()
+                }
+            }
+            
             // 1. Semantic Search for Context
             var relevantItems: [Item] = []
             
-            // Perform vector search
-            let searchResults = await clippy.search(query: capturedText, limit: 30)
+            // Perform vector search (skipped for chit-chat; recent items below still give context)
+            let searchResults: [(UUID, Float)]
+            if shouldRetrieve(capturedText) {
+                searchResults = await clippy.search(query: capturedText, limit: 30)
+            } else {
+                print("⏭️ [ContentView] Skipping vector search for chit-chat query")
+                searchResults = []
+            }
             let foundVectorIds = Set(searchResults.map { $0.0 })
             
             if !foundVectorIds.isEmpty {
-                // Filter allItems for matching IDs
-                // Note: Efficient enough for typical usage; huge DBs might need optimization
-                let itemsWithIDs = allItems.filter { item in
-                    guard let vid = item.vectorId else { return false }
-                    return foundVectorIds.contains(vid)
+                // Index matching items by vector ID in one pass over allItems
+                var itemsByVectorId: [UUID: Item] = [:]
+                for item in allItems {
+                    if let vid = item.vectorId, foundVectorIds.contains(vid), itemsByVectorId[vid] == nil {
+                        itemsByVectorId[vid] = item
+                    }
                 }
                 
                 // Sort by search score (re-order based on searchResults order)
-                relevantItems = searchResults.compactMap { (id, _) in
-                    itemsWithIDs.first(where: { $0.vectorId == id })
-                }
+                relevantItems = searchResults.compactMap { (id, _) in itemsByVectorId[id] }
             }
             
             // 2. Fallback / Supplement with Recent Items
@@ -387,6 +401,8 @@ struct ContentView: View {
             let answer: String?
             let imageIndex: Int?
             
+            await modelWarmup.value
+            
             switch selectedAIService {
             case .gemini:
                 // Gemini service might need update or we keep it compatible with old struct if it uses a different one
@@ -436,6 +452,21 @@ struct ContentView: View {
         }
     }
     
+    /// Greetings and acknowledgements that never need a clipboard search
+    private static let chitChatPattern = try! NSRegularExpression(
+        pattern: #"^\s*(hi|hello|hey|yo|thanks|thank you|thx|ok|okay|cool|nice|great|bye)[\s.!?]*$"#,
+        options: [.caseInsensitive]
+    )
+    
+    /// Cheap first-stage check so chit-chat doesn't pay for an embedding + vector search
+    private func shouldRetrieve(_ query: String) -> Bool {
+        let trimmed = query.trimmingCharacters(in: .whitespacesAndNewlines)
+        if trimmed.count < 3 { return false }
+        
+        let range = NSRange(trimmed.startIndex..., in: trimmed)
+        return Self.chitChatPattern.firstMatch(in: trimmed, range: range) == nil
+    }
+    
     private func handleAIResponse(answer: String?, imageIndex: Int?, contextItems: [Item], errorMessage: String? = nil) {
         // Calculate how long we've been in thinking state
         let elapsed = Date().timeIntervalSince(thinkingStartTime ?? Date())
@@ -599,6 +630,22 @@ struct ContentView: View {
         // and GeminiService handles its own key state.
     }
     
+    /// Local .env values, parsed once per launch; the Settings binding reads keys on every render
+    private static let developmentEnv: [String: String] = {
+        let envPath = URL(fileURLWithPath: #file).deletingLastPathComponent().deletingLastPathComponent().appendingPathComponent(".env")
+        guard let content = try? String(contentsOf: envPath, encoding: .utf8) else { return [:] }
+        
+        var values: [String: String] = [:]
+        for line in content.components(separatedBy: .newlines) {
+            guard let separator = line.firstIndex(of: "=") else { continue }
+            let key = String(line[..<separator])
+            if values[key] == nil {
+                values[key] = line[line.index(after: separator)...].trimmingCharacters(in: .whitespacesAndNewlines)
+            }
+        }
+        return values
+    }()
+    
     private func getStoredAPIKey() -> String {
         // 1. Check process environment
         if let envKey = ProcessInfo.processInfo.environment["GEMINI_API_KEY"], !envKey.isEmpty { return envKey }
@@ -608,18 +655,8 @@ struct ContentView: View {
             return stored
         }
         
-        // 3. Check local .env file manually (Fallback for development)
-        let envPath = URL(fileURLWithPath: #file).deletingLastPathComponent().deletingLastPathComponent().appendingPathComponent(".env")
-        if let content = try? String(contentsOf: envPath, encoding: .utf8) {
-            let lines = content.components(separatedBy: .newlines)
-            for line in lines {
-                if line.starts(with: "GEMINI_API_KEY=") {
-                    return line.replacingOccurrences(of: "GEMINI_API_KEY=", with: "").trimmingCharacters(in: .whitespacesAndNewlines)
-                }
-            }
-        }
-        
-        return ""
+        // 3. Check local .env file (Fallback for development)
+        return Self.developmentEnv["GEMINI_API_KEY"] ?? ""
     }
     
     private func getStoredElevenLabsKey() -> String {
@@ -631,18 +668,8 @@ struct ContentView: View {
             return stored
         }
         
-        // 3. Check local .env file manually (Fallback for development)
-        let envPath = URL(fileURLWithPath: #file).deletingLastPathComponent().deletingLastPathComponent().appendingPathComponent(".env")
-        if let content = try? String(contentsOf: envPath, encoding: .utf8) {
-            let lines = content.components(separatedBy: .newlines)
-            for line in lines {
-                if line.starts(with: "ELEVENLABS_API_KEY=") {
-                    return line.replacingOccurrences(of: "ELEVENLABS_API_KEY=", with: "").trimmingCharacters(in: .whitespacesAndNewlines)
-                }
-            }
-        }
-        
-        return ""
+        // 3. Check local .env file (Fallback for development)
+        return Self.developmentEnv["ELEVENLABS_API_KEY"] ?? ""
     }
 }
 
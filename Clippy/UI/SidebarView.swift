@@ -23,6 +23,7 @@ struct SidebarView: View {
     @Environment(\.modelContext) private var modelContext
     @EnvironmentObject var container: AppDependencyContainer
     @State private var showClearConfirmation: Bool = false
+    @State private var reindexError: String? // Shown as an alert when re-indexing fails
     @AppStorage("showSidebarShortcuts") private var showShortcuts: Bool = false
     
     var body: some View {
@@ -139,6 +140,14 @@ struct SidebarView: View {
         } message: {
             Text("This will permanently delete all clipboard items. This action cannot be undone.")
         }
+        .alert(
+            "Re-index Failed",
+            isPresented: Binding(get: { reindexError != nil }, set: { if !$0 { reindexError = nil } })
+        ) {
+            Button("OK", role: .cancel) { }
+        } message: {
+            Text("Search may miss items until re-indexing succeeds. \(reindexError ?? "")")
+        }
     }
     
     private func clearAllHistory() {
@@ -150,10 +159,8 @@ struct SidebarView: View {
                 let descriptor = FetchDescriptor<Item>()
                 let items = try modelContext.fetch(descriptor)
                 
-                for item in items {
-                    // Use repository to ensure consistent deletion (Files + Vector + Data)
-                    try await repository.deleteItem(item)
-                }
+                // Use repository to ensure consistent deletion (Vector + Data; image files are left on disk)
+                try await repository.deleteItems(items)
                 
                 print("🗑️ [SidebarView] Cleared all \(items.count) clipboard items")
             } catch {
@@ -166,23 +173,23 @@ struct SidebarView: View {
         Task {
             do {
                 print("🔄 [SidebarView] Starting re-indexing...")
-                let descriptor = FetchDescriptor<Item>()
-                let items = try modelContext.fetch(descriptor)
-                
-                let documents = items.compactMap { item -> (UUID, String)? in
-                    guard let vid = item.vectorId else { return nil }
-                    let embeddingText = (item.title != nil && !item.title!.isEmpty) ? "\(item.title!)\n\n\(item.content)" : item.content
-                    return (vid, embeddingText)
+                let count = try await container.clippy.rebuildIndex {
+                    let items = try modelContext.fetch(FetchDescriptor<Item>())
+                    return items.compactMap { item -> (UUID, String)? in
+                        guard let vid = item.vectorId else { return nil }
+                        let embeddingText = (item.title != nil && !item.title!.isEmpty) ? "\(item.title!)\n\n\(item.content)" : item.content
+                        return (vid, embeddingText)
+                    }
                 }
                 
-                if !documents.isEmpty {
-                    await container.clippy.addDocuments(items: documents)
-                    print("✅ [SidebarView] Re-indexed \(documents.count) items")
+                if count > 0 {
+                    print("✅ [SidebarView] Re-indexed \(count) items")
                 } else {
                     print("⚠️ [SidebarView] No items to re-index")
                 }
             } catch {
                 print("❌ [SidebarView] Failed to re-index: \(error)")
+                reindexError = error.localizedDescription
             }
         }
     }